@@ -11,7 +11,50 @@ __title__       = "SolidWrap"
 __author__      = "Sean Yeatts"
 __copyright__   = "Copyright (c) 2024 Sean Yeatts. All rights reserved."
 
+import importlib
+
 from .containers import *
-from .solidwrap import *
 from .logger import *
 from .utilities import *
+
+
+# LAZY SYMBOLS
+# The COM layer ( pywin32 ) is only imported once one of these is accessed,
+# keeping 'import solidwrap' cheap for scripts that only need containers.
+_lazy_symbols = ('SolidWorks', 'Vault', 'init_com_thread')
+
+__all__ = [
+    # containers
+    'Filepath',
+    'SWAuthState',
+    'SWDocType',
+    'SWDocument',
+    'SWExportFormat',
+    'format_doctype',
+
+    # logger
+    'log',
+    'set_verbose',
+
+    # utilities
+    'AUTOMATION_MESSAGE',
+    'EXPORT_FOLDER_DEFAULT',
+    'SUBPROCESS_NAME',
+    'VAULT_DISPATCH_KEY',
+    'FileSize',
+    'compute_client_key',
+    'singleton',
+
+    *_lazy_symbols
+]
+
+
+def __getattr__(name: str):
+    '''Resolves COM-backed symbols on first access ( PEP 562 ).'''
+    if name == 'solidwrap' or name in _lazy_symbols:
+        module = importlib.import_module('.solidwrap', __name__)
+        if name == 'solidwrap':
+            return module
+        value = globals()[name] = getattr(module, name)
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -14,7 +14,7 @@ from quickpathstr import Filepath
 # IMPORTS - STANDARD LIBRARY
 import os
 from enum import Enum, auto
-from typing import Any
+from typing import Any, Dict
 
 # IMPORTS - PROJECT
 from solidwrap.utilities import FileSize
@@ -48,22 +48,95 @@ class SWExportFormat(Enum):
 class SWDocument:
     '''Logical wrapper for SolidWorks & PDM API objects.'''
 
+    # One instance per open document; fixed slots keep them small
+    __slots__ = (
+        'swobj', '_pathname', '_source', '_doctype', '_size', '_extension',
+        '_feature_manager', 'is_loading', 'is_staged'
+    )
+
     # FUNDAMENTAL METHODS
-    def __init__(self, swobj: Any) -> None:
+    def __init__(self, swobj: Any, source: Filepath = None) -> None:
 
         # SolidWorks API COM object
         self.swobj: Any = swobj # IModelDoc2
 
-        # Core attributes
-        self.source     = Filepath(swobj.GetPathName)
-        self.doctype    = format_doctype(self.source)
-        self.size       = FileSize(os.path.getsize(self.source.complete))
+        # Set while SolidWorks is still loading the document in the background
+        self.is_loading = False
+
+        # Set once the viewport has been staged ( see SolidWorks.stage )
+        self.is_staged  = False
+
+        # Lazily resolved attributes ( see properties )
+        self._pathname: str = None
+        self._source: Filepath = source     # known when opened by SolidWrap
+        self._doctype: SWDocType = None
+        self._size: FileSize = None
+        self._extension: Any = None
+        self._feature_manager: Any = None
+
+    # PROPERTIES ( resolved on first access )
+    @property
+    def pathname(self) -> str:
+        '''Complete path of the document, as reported by SolidWorks ( fetched
+        over COM on first access ).'''
+        if self._pathname is None:
+            self._pathname = self.swobj.GetPathName()
+        return self._pathname
+
+    @property
+    def source(self) -> Filepath:
+        '''Filepath representation of the document.'''
+        if self._source is None:
+            self._source = Filepath(self.pathname)
+        return self._source
+
+    @property
+    def complete(self) -> str:
+        '''Complete filepath ( same as source.complete ).'''
+        return self.source.complete
+
+    @property
+    def name(self) -> str:
+        '''File name ( same as source.name ).'''
+        return self.source.name
+
+    @property
+    def doctype(self) -> SWDocType:
+        '''Document type, derived from the file extension.'''
+        if self._doctype is None:
+            self._doctype = format_doctype(self.source)
+        return self._doctype
+
+    @property
+    def size(self) -> FileSize:
+        '''Size of the document on disk.'''
+        if self._size is None:
+            self._size = FileSize(os.path.getsize(self.complete))
+        return self._size
+
+    @property
+    def extension(self) -> Any:
+        '''SW-API document extension interface ( IModelDocExtension ).'''
+        if self._extension is None:
+            self._extension = self.swobj.Extension
+        return self._extension
+
+    @property
+    def feature_manager(self) -> Any:
+        '''SW-API Feature Manager interface ( IFeatureManager ).'''
+        if self._feature_manager is None:
+            self._feature_manager = self.swobj.FeatureManager
+        return self._feature_manager
 
 
 # FUNCTIONS
 def format_doctype(filepath: Filepath) -> SWDocType:
     '''Formats a doctype from a file's extension.'''
-    extension = filepath.extension.replace('.','')
-    for string in SWDocType:
-        if string.value == extension:
-            return string
+    return doctype_lookup.get(filepath.extension.lstrip('.').upper())
+
+
+# OBJECTS
+# Which document type does each ( uppercase ) file extension represent?
+doctype_lookup: Dict[str, SWDocType] = {
+    doctype.value: doctype for doctype in SWDocType
+}
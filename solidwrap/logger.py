@@ -10,22 +10,50 @@ import logging
 # SYMBOLS
 __all__ = [
     'log',
+    'set_verbose',
 ]
 
 
+# CLASSES
+class LevelFilter(logging.Filter):
+    '''Passes records whose level falls within [ minimum, maximum ).'''
+
+    # FUNDAMENTAL METHODS
+    def __init__(self, minimum: int, maximum: int = logging.CRITICAL + 1) -> None:
+        super().__init__()
+        self.minimum = minimum
+        self.maximum = maximum
+
+    # FILTER METHODS
+    def filter(self, record: logging.LogRecord) -> bool:
+        return self.minimum <= record.levelno < self.maximum
+
+
+# FUNCTIONS
+def set_verbose(verbose: bool = True) -> None:
+    '''Toggles routine ( INFO ) chatter; warnings & errors are always shown.
+    Quiet batch runs skip formatting every per-document message.'''
+    log.setLevel(logging.INFO if verbose else logging.WARNING)
+
+
 # Setup module logger
 log = logging.getLogger(__name__)
 log.setLevel(logging.INFO)
 
-# Configure console handler
-handler = logging.StreamHandler()
-handler.setLevel(logging.DEBUG)
+# Configure console handlers ( routine chatter skips the timestamp )
+brief = logging.StreamHandler()
+brief.setLevel(logging.DEBUG)
+brief.addFilter(LevelFilter(logging.DEBUG, logging.WARNING))
+
+detailed = logging.StreamHandler()
+detailed.setLevel(logging.WARNING)
 
-# Configure formatter
-string = f'%(asctime)s %(levelname)s - %(message)s'
-date = f'%H:%M:%S'
-formatter = logging.Formatter(string, datefmt=date)
+# Configure formatters
+string = '%(asctime)s %(levelname)s - %(message)s'
+date = '%H:%M:%S'
+brief.setFormatter(logging.Formatter('%(message)s'))
+detailed.setFormatter(logging.Formatter(string, datefmt=date))
 
 # Assign configured parameters
-handler.setFormatter(formatter)
-log.addHandler(handler)
+log.addHandler(brief)
+log.addHandler(detailed)
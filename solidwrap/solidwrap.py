@@ -7,12 +7,25 @@ from __future__ import annotations
 from quickpathstr import Filepath           # file / folder manipulation
 
 # IMPORTS - STANDARD LIBRARY
+import asyncio                              # concurrent COM calls
+import atexit                               # COM teardown
+import functools                            # result caching
+import logging                              # log level checks
 import os                                   # file / folder manipulation
 import pythoncom        as pycom            # used with win32com.client
-import subprocess       as subproc          # process termination
+import queue                                # batch work distribution
+import threading                            # worker thread state
+import time                                 # background load polling
 import win32com.client  as win              # COM object handling
+from win32com.client import gencache        # early-bound COM wrappers
+import win32api                             # process termination
+import win32con                             # process access rights
+import win32event                           # process exit wait
+import win32process                         # process identification
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor  # pipelines
+from contextlib import contextmanager       # scoped client settings
 from pathlib import Path                    # file / folder manipulation
-from typing import Any, Dict, List, Type    # type checking
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Set, Tuple  # type checking
 
 # IMPORTS - PROJECT
 from solidwrap.containers import SWAuthState, SWDocType, SWExportFormat, SWDocument
@@ -20,9 +33,18 @@ from solidwrap.logger import log
 from solidwrap.utilities import compute_client_key, singleton
 from solidwrap.utilities import (
     AUTOMATION_MESSAGE,
+    BACKGROUND_LOAD_TIMEOUT,
+    BACKGROUND_OPEN_THRESHOLD,
+    BACKGROUND_POLL_INTERVAL,
+    BATCH_GET_LOCK,
+    BATCH_GET_UTILITY,
+    BATCH_UNLOCK_FLAGS,
+    BATCH_UNLOCK_UTILITY,
+    EXIT_TIMEOUT,
     EXPORT_FOLDER_DEFAULT,
-    SUBPROCESS_NAME,
-    VAULT_DISPATCH_KEY
+    RPC_E_CHANGED_MODE,
+    VAULT_DISPATCH_KEY,
+    VAULT_WORKERS_DEFAULT
 )
 
 
@@ -30,6 +52,7 @@ from solidwrap.utilities import (
 __all__ = [
     'SolidWorks',
     'Vault',
+    'init_com_thread',
     'SWDocument',
     'SWDocType',
     'SWExportFormat',
@@ -48,28 +71,80 @@ class SolidWorks:
     
     # CLASS ATTRIBUTES
     client: Any = None
+    __slots__ = (
+        'version', '_pid', '_clsid', '_worker', '_command_depth', '_command_lock',
+        '_freeze_bar', '_open_lock', '_background_loads', '_background_restore'
+    )
+
+    # Constant COM VARIANT args ( built once, shared by every call )
+    _OPEN_DOC_TYPES = {key: win.VARIANT(pycom.VT_I4, key) for key in range(4)}
+    _OPEN_TYPE_KEYS = {     # swDocumentTypes_e, keyed by uppercase extension
+        SWDocType.PART.value:       1,
+        SWDocType.ASSEMBLY.value:   2,
+        SWDocType.DRAWING.value:    3
+    }
+    _OPEN_OPTIONS   = win.VARIANT(pycom.VT_I4,      1)
+    _OPEN_CONFIG    = win.VARIANT(pycom.VT_BSTR,    None)
+    _REBUILD_SCOPES = {
+        flag: win.VARIANT(pycom.VT_BYREF | pycom.VT_I4, flag)
+        for flag in (False, True)
+    }
+    _SAVE_OPTIONS   = {     # swSaveAsOptions_e, keyed by rebuild flag
+        True:   1,      # Silent
+        False:  1 | 8   # Silent | AvoidRebuildOnSave
+    }
+    _EXPORT_DATA    = win.VARIANT(pycom.VT_DISPATCH,   None)
+    _EXPORT_PREFIX  = win.VARIANT(pycom.VT_BOOL,       0)
+    _STAGE_HIDE_ALL = win.VARIANT(pycom.VT_I4,      198)    # swViewDisplayHideAllTypes
+    _STAGE_VIEW     = 'Isometric'
+    _STAGE_VIEW_ID  = 7     # swStandardViews_e.swIsometricView
+    _STAGE_SCENE    = r"\scenes\01 basic scenes\11 white kitchen.p2s"
+    _FREEZE_BAR     = win.VARIANT(pycom.VT_I4,      461)    # swUserPreferenceToggle_e
+    _FREEZE_POSITION = win.VARIANT(pycom.VT_I4,     3)      # swMoveFreezeBarTo_e
 
     # FUNDAMENTAL METHODS
     def __init__(self, version: int = 2023) -> None:
+        init_com_thread()
         self.version = version
+        self._pid: int = None   # SLDWORKS.exe process ID
+        self._clsid: Any = None # client CLSID ( resolved on first connect )
+        self._worker: ThreadPoolExecutor = None  # pipeline executor ( see submit )
+        self._command_depth: int = 0            # nested CommandInProgress scopes
+        self._command_lock = threading.Lock()
+        self._freeze_bar: bool = False          # freeze bar shown this session
+        self._open_lock = threading.RLock()     # background flag + OpenDoc6
+        self._background_loads: int = 0         # documents still loading
+        self._background_restore: bool = False  # flag value before the loads
 
     # LIFETIME MANAGEMENT METHODS
     def connect(self, headless: bool = False) -> bool:
         '''Creates a connection to the SolidWorks client.'''
-        log.critical(f"connecting to SolidWorks client ( {self.version} )")
-        client_key = compute_client_key(self.version)
+        log.critical("connecting to SolidWorks client ( %s )", self.version)
 
         # Attempt client dispatch
         log.info('establishing connection...')
         try:
-            pycom.CoInitialize()
-            if (com_object := win.Dispatch(client_key)):
+            if self._clsid is None:     # ProgID -> CLSID registry lookup
+                self._clsid = pycom.MakeIID(compute_client_key(self.version))
+            if (com_object := gencache.EnsureDispatch(self._clsid)):
                 SolidWorks.client = com_object
+                self._freeze_bar = False
+                self._background_loads = 0
 
                 # Enforce visibility
-                SolidWorks.client.visible               = not headless
+                SolidWorks.client.Visible               = not headless
                 SolidWorks.client.UserControlBackground = headless
-                SolidWorks.client.Frame.KeepInvisible   = headless
+                SolidWorks.client.Frame().KeepInvisible = headless
+
+                # Record the process ID for forced termination ( best-effort;
+                # only the kill fallback needs it )
+                try:
+                    hwnd = SolidWorks.client.Frame().GetHWnd()
+                    _, self._pid = win32process.GetWindowThreadProcessId(hwnd)
+                except Exception as exception:
+                    log.warning('could not resolve SolidWorks process ID')
+                    log.warning(exception)
+                    self._pid = None
                 
                 log.info('connection successfully established')
                 return True
@@ -80,14 +155,17 @@ class SolidWorks:
 
     def disconnect(self, silent: bool = True) -> bool:
         '''Terminates the SolidWorks connection.'''
-        log.critical(f"disconnecting from SolidWorks client ( {self.version} )")
+        log.critical("disconnecting from SolidWorks client ( %s )", self.version)
         
         # Attempt to terminate the subprocess
         try:
+            if self._worker is not None:
+                self._worker.shutdown(wait=True)    # drain queued pipelines
+                self._worker = None
+            verified_destinations.clear()
             if not silent:
                 log.info('terminating subprocess')
-                subproc.call(SUBPROCESS_NAME)
-            pycom.CoUninitialize()
+                self._terminate()
             SolidWorks.client = None
             log.info('connection successfully terminated')
             return True
@@ -96,156 +174,394 @@ class SolidWorks:
             log.error(exception)
             return False
 
+    def _terminate(self) -> None:
+        '''Exits the SolidWorks application, killing its process if it is
+        still running once the graceful exit has had time to finish.'''
+
+        # Open the process first; ExitApp may return while SolidWorks lingers
+        # ( ex. blocked on a hidden save prompt )
+        handle = None
+        if self._pid is not None:
+            try:
+                handle = win32api.OpenProcess(
+                    win32con.PROCESS_TERMINATE | win32con.SYNCHRONIZE, False, self._pid
+                )
+            except Exception as exception:
+                log.warning('could not open SolidWorks process')
+                log.warning(exception)
+        try:
+            try:
+                # Execute SW-API method
+                SolidWorks.client.ExitApp()
+            except Exception as exception:
+                log.warning('graceful exit failed')
+                log.warning(exception)
+            if handle is None:
+                return None
+
+            # Wait for the exit, then kill the process if it is still alive
+            timeout = int(EXIT_TIMEOUT * 1000)     # milliseconds
+            if win32event.WaitForSingleObject(handle, timeout) != win32event.WAIT_OBJECT_0:
+                log.warning('SolidWorks did not exit, killing process')
+                win32api.TerminateProcess(handle, 0)
+        finally:
+            if handle is not None:
+                win32api.CloseHandle(handle)
+
     # DOCUMENT MANAGEMENT METHODS
     def open(self, filepath: Filepath) -> SWDocument:
         '''Opens a document using a prescribed filepath.'''
-        log.info(f"opening document: '{filepath.name}'")
+        log.info("opening document: '%s'", filepath.name)
 
         # Evaluate document type by extension ( period removed )
-        type_key: int = 0
-        match str.upper(filepath.extension.replace('.', '')):
-            case SWDocType.PART.value:
-                type_key = 1
-            case SWDocType.ASSEMBLY.value:
-                type_key = 2
-            case SWDocType.DRAWING.value:
-                type_key = 3
-
-        # Define COM VARIANT args
-        source      = win.VARIANT(pycom.VT_BSTR,    filepath.complete)
-        doc_type    = win.VARIANT(pycom.VT_I4,      type_key)
-        options     = win.VARIANT(pycom.VT_I4,      1)
-        config      = win.VARIANT(pycom.VT_BSTR,    None)
-        errors      = win.VARIANT(pycom.VT_BYREF |  pycom.VT_I4, 2)
-        warnings    = win.VARIANT(pycom.VT_BYREF |  pycom.VT_I4, 128)
+        type_key = self._OPEN_TYPE_KEYS.get(filepath.extension.lstrip('.').upper())
+        if type_key is None:
+            log.warning("cannot open document: '%s'", filepath.name)
+            log.warning("unsupported file type: '%s'", filepath.extension)
+            return None
 
-        # SolidWorks API call
-        swobj = SolidWorks.client.OpenDoc6(
-            source, doc_type, options, config, errors, warnings
-        )
+        # Load drawings & large documents in the background
+        try:
+            background = (
+                type_key == 3 or
+                os.path.getsize(filepath.complete) >= BACKGROUND_OPEN_THRESHOLD
+            )
+        except OSError as exception:
+            log.error("cannot open document: '%s'", filepath.name)
+            log.error(exception)
+            return None
+
+        # Define COM VARIANT args ( out-params are reused per thread )
+        source      = bstr_variant(filepath.complete)
+        errors, warnings = status_variants(2, 128)
+
+        # SolidWorks API call ( the background flag is application-wide: it
+        # stays on until every background load has completed, see await_ready )
+        client = SolidWorks.client
+        with self._open_lock:
+            loading = background or self._background_loads > 0
+            if loading:
+                self._begin_background_load()
+            else:
+                previous = client.EnableBackgroundProcessing
+                client.EnableBackgroundProcessing = False
+            try:
+                swobj = client.OpenDoc6(
+                    source, self._OPEN_DOC_TYPES[type_key], self._OPEN_OPTIONS,
+                    self._OPEN_CONFIG, errors, warnings
+                )
+            except Exception:
+                if loading:
+                    self._end_background_load()
+                raise
+            finally:
+                if not loading:
+                    client.EnableBackgroundProcessing = previous
+
+        if swobj is None:
+            if loading:
+                self._end_background_load()
+            log.error("failed to open document: '%s'", filepath.name)
+            log.error("swFileLoadError_e: %s", errors.value)
+            return None
 
-        # Return wrapped com object
-        return SWDocument(swobj)
+        # Return wrapped com object ( may still be loading )
+        document = SWDocument(swobj, filepath)
+        document.is_loading = loading
+        return document
+
+    def _begin_background_load(self) -> None:
+        '''Turns background processing on for the first pending load.'''
+        with self._open_lock:
+            if self._background_loads == 0:
+                client = SolidWorks.client
+                self._background_restore = client.EnableBackgroundProcessing
+                client.EnableBackgroundProcessing = True
+            self._background_loads += 1
+
+    def _end_background_load(self) -> None:
+        '''Restores background processing once the last pending load ends.'''
+        with self._open_lock:
+            self._background_loads -= 1
+            if self._background_loads == 0:
+                SolidWorks.client.EnableBackgroundProcessing = self._background_restore
 
     def close(self, document: SWDocument) -> None:
         '''Closes a target document ( WITHOUT rebuild & save operations ).'''
-        log.info(f"closing document: '{document.source.name}'")
+        self.await_ready(document)     # closed either way; a stalled load is dropped
+        log.info("closing document: '%s'", document.name)
 
         # SolidWorks API call
-        SolidWorks.client.CloseDoc(document.source.complete)
+        SolidWorks.client.CloseDoc(document.complete)
 
-    def safeclose(self, document: SWDocument) -> None:
-        '''Closes a target document ( WITH rebuild & save operations ).'''
-        self.rebuild(document, False)
-        self.save(document)
-        self.close(document)
-
-    def save(self, document: SWDocument) -> None:
-        '''Saves a target document.'''
-        log.info(f"saving document: '{document.source.name}'")
+    def safeclose(self, document: SWDocument, force: bool = False,
+        rebuild: bool = True) -> None:
+        """
+        Closes a target document ( WITH rebuild & save operations ).
+        
+        Documents without unsaved changes skip the rebuild & save unless
+        'force' is set. The rebuild is performed by Save3 itself, in the same
+        COM call as the save, and is skipped for fully rebuilt models. Pass
+        'rebuild=False' to save the document exactly as it stands ( ex. after
+        an export of the already-open state ).
+        """
+        if not self.await_ready(document):
+            log.warning("skipping save, closing document: '%s'", document.name)
+            return self.close(document)
+        with self._command():
+            if force:
+                self.save(document, rebuild=rebuild)
+            elif document.swobj.GetSaveFlag():
+                # swModelRebuildStatus_e : 0 = fully rebuilt
+                self.save(document, rebuild=(
+                    rebuild and bool(document.extension.NeedsRebuild2)
+                ))
+            self.close(document)
+
+    def save(self, document: SWDocument, rebuild: bool = True) -> None:
+        """
+        Saves a target document.
+        
+        Save3 rebuilds out-of-date features before writing; pass
+        'rebuild=False' to save the document as-is.
+        """
+        if not self.await_ready(document):
+            return None
+        log.info("saving document: '%s'", document.name)
 
-        # Define COM VARIANT args
-        options     = win.VARIANT(pycom.VT_BYREF | pycom.VT_I4, 1)
-        errors      = win.VARIANT(pycom.VT_BYREF | pycom.VT_I4, 1)
-        warnings    = win.VARIANT(pycom.VT_BYREF | pycom.VT_I4, 1)
-
-        # SolidWorks API call
-        document.swobj.Save3(options, errors, warnings)
+        # SolidWorks API call ( early binding packs the errors & warnings
+        # out-params from the type library )
+        document.swobj.Save3(self._SAVE_OPTIONS[bool(rebuild)], 0, 0)
 
     def rebuild(self, document: SWDocument, top_only: bool = False) -> None:
         '''Rebuilds a target document.'''
-        log.info(f"rebuilding document: '{document.source.name}'")
+        if not self.await_ready(document):
+            return None
+        log.info("rebuilding document: '%s'", document.name)
         
-        # Define COM VARIANT args
-        top_only = win.VARIANT(pycom.VT_BYREF | pycom.VT_I4, top_only)
+        # Execute SW-API method ( the viewport must be staged again )
+        document.swobj.ForceRebuild3(self._REBUILD_SCOPES[bool(top_only)])
+        document.is_staged = False
+
+    def await_ready(self, document: SWDocument) -> bool:
+        '''Blocks until a document opened in the background has loaded. Returns
+        False if the load did not complete within BACKGROUND_LOAD_TIMEOUT.'''
+        if not document.is_loading:
+            return True
+        log.debug("waiting for background load: '%s'", document.name)
+
+        # Poll SW-API until background processing completes ( or times out )
+        deadline = time.monotonic() + BACKGROUND_LOAD_TIMEOUT
+        try:
+            while not SolidWorks.client.IsBackgroundProcessingCompleted(document.complete):
+                if time.monotonic() >= deadline:
+                    log.error("background load timed out: '%s'", document.name)
+                    return False
+                time.sleep(BACKGROUND_POLL_INTERVAL)
+            return True
+        finally:
+            document.is_loading = False
+            self._end_background_load()
+
+    # BATCH METHODS
+    @contextmanager
+    def bulk(self) -> Iterator[None]:
+        """
+        Suspends interactive updates & UI dialogs while the enclosed block
+        runs. Wrap loops over many documents ( ex. repeated save calls ) to
+        avoid a redraw per operation. Nested blocks are allowed.
+        """
+        client = SolidWorks.client
+        user_control = client.UserControl
+        client.UserControl = False
+        try:
+            with self._command():
+                yield
+        finally:
+            client.UserControl = user_control
+
+    @contextmanager
+    def _command(self) -> Iterator[None]:
+        '''Flags SolidWorks as busy ( CommandInProgress ) for the enclosed
+        sequence of COM calls, so that it skips intermediate UI updates.
+        Nested scopes only toggle the flag at the outermost level.'''
+        with self._command_lock:
+            self._command_depth += 1
+            if self._command_depth == 1:
+                SolidWorks.client.CommandInProgress = True
+        try:
+            yield
+        finally:
+            with self._command_lock:
+                self._command_depth -= 1
+                if self._command_depth == 0:
+                    SolidWorks.client.CommandInProgress = False
+
+    def batch(self, documents: List[SWDocument],
+        operation: Callable[[SWDocument], Any]) -> List[Any]:
+        """
+        Applies an operation to each document in turn inside a single bulk()
+        window, so SolidWorks defers UI updates until the whole sequence has
+        finished ( ex. solidworks.batch(documents, solidworks.export) ).
+        Returns the operation results in order.
+        """
+        with self.bulk():
+            return [operation(document) for document in documents]
 
-        # Execute SW-API method
-        document.swobj.ForceRebuild3(top_only)
+    def submit(self, filepath: Filepath,
+        operations: List[Callable[[SWDocument], Any]]) -> Future:
+        """
+        Queues a document pipeline on the SolidWorks worker thread: the
+        document is opened, then each operation is applied to it in order
+        ( ex. [solidworks.freeze, solidworks.safeclose] ). Returns a Future
+        resolving to the list of operation results. Pipelines run one at a
+        time, in submission order, while the caller keeps queueing work.
+        
+        Called from a single-threaded COM apartment, the pipeline runs on the
+        calling thread instead and the Future is already resolved.
+        """
+        if not is_multithreaded():
+            # Clients owned by a single-threaded apartment can't leave this
+            # thread; run the pipeline here instead
+            future = Future()
+            try:
+                future.set_result(self._pipeline(filepath, operations))
+            except Exception as exception:
+                future.set_exception(exception)
+            return future
+        if self._worker is None:
+            self._worker = ThreadPoolExecutor(
+                max_workers=1,
+                initializer=init_com_thread,
+                thread_name_prefix='solidwrap'
+            )
+        return self._worker.submit(self._pipeline, filepath, operations)
+
+    def _pipeline(self, filepath: Filepath,
+        operations: List[Callable[[SWDocument], Any]]) -> List[Any]:
+        '''Opens a document and applies a sequence of operations to it.'''
+        if (document := self.open(filepath)) is None:
+            return []
+        return [operation(document) for operation in operations]
 
     # HIGH-LEVEL METHODS
     def export(self, document: SWDocument, as_type: SWExportFormat,
         destination: Filepath = None) -> None:
         '''Exports a document using a prescribed format.'''
+        if not self.await_ready(document):
+            return None
         
-        # Technical setup
-        output = prepare_export(document, as_type, destination)
+        # Technical setup ( incompatible formats are rejected )
+        if (output := prepare_export(document, as_type, destination)) is None:
+            return None
 
-        # Graphical setup
-        self.stage(document)
+        with self._command():
 
-        log.info(f"exporting document: '{output.name}'")
+            # Graphical setup
+            self.stage(document)
 
-        # Define COM VARIANT args
-        data        = win.VARIANT(pycom.VT_DISPATCH,   None)
-        prefix      = win.VARIANT(pycom.VT_BOOL,       0) 
-        errors      = win.VARIANT(pycom.VT_BYREF |     pycom.VT_I4, 0)
-        warnings    = win.VARIANT(pycom.VT_BYREF |     pycom.VT_I4, 0)
+            log.info("exporting document: '%s'", os.path.basename(output))
 
-        # Execute SW-API method
-        document.swobj.Extension.SaveAs2(
-            output.complete, 0, 1, data, "", prefix, errors, warnings
-        )
+            # Define COM VARIANT args ( out-params are reused per thread )
+            errors, warnings = status_variants()
+
+            # Execute SW-API method
+            document.extension.SaveAs2(
+                output, 0, 1, self._EXPORT_DATA, "", self._EXPORT_PREFIX,
+                errors, warnings
+            )
 
     def stage(self, document: SWDocument) -> None:
         '''Declutters the viewport and orients an isometric model view.'''
-        log.info(f"staging document: '{document.source.name}'")
+        log.info("staging document: '%s'", document.name)
 
-        # Reject drawings
-        if document.doctype == SWDocType.DRAWING:
+        # Reject drawings, unloaded documents & documents that are already staged
+        if document.is_staged or document.doctype == SWDocType.DRAWING:
+            return None
+        if not self.await_ready(document):
             return None
 
-        # Define COM VARIANT args & various other datapoints
-        setting = win.VARIANT(pycom.VT_I4, 198)
-        view_id = 7
-        scene   = fr"\scenes\01 basic scenes\11 white kitchen.p2s"
-        
-        # Execute SW-API method - hide all types (planes, sketches, etc.)
-        document.swobj.Extension.SetUserPreferenceToggle(setting, 0, True)
+        # Get SW-API objects
+        swobj = document.swobj                          # IModelDoc2
+        extension = document.extension                  # IModelDocExtension
+
+        with self._command():
 
-        # Execute SW-API method - orient document
-        document.swobj.ShowNamedView2('Isometric', view_id)
+            # Execute SW-API method - hide all types (planes, sketches, etc.)
+            extension.SetUserPreferenceToggle(self._STAGE_HIDE_ALL, 0, True)
 
-        # Execute SW-API method - center document in viewport
-        document.swobj.ViewZoomtofit2()
+            # Execute SW-API method - orient document
+            swobj.ShowNamedView2(self._STAGE_VIEW, self._STAGE_VIEW_ID)
 
-        # Execute SW-API method - force background to plain white
-        document.swobj.Extension.InsertScene(scene)
+            # Execute SW-API method - center document in viewport
+            swobj.ViewZoomtofit2()
+
+            # Execute SW-API method - force background to plain white
+            extension.InsertScene(self._STAGE_SCENE)
+        document.is_staged = True
 
     def freeze(self, document: SWDocument) -> None:
         '''Freezes a target document's Feature Tree.'''
-        log.info(f"freezing document: '{document.source.name}'")
+        if not self.await_ready(document):
+            return None
+        log.info("freezing document: '%s'", document.name)
 
-        # Define COM VARIANT args
-        setting     = win.VARIANT(pycom.VT_I4,  461)
-        position    = win.VARIANT(pycom.VT_I4,  3)
-        
-        # Execute SW-API method - show freeze bar
-        SolidWorks.client.SetUserPreferenceToggle(setting, True)
+        with self._command():
 
-        # Get last feature in Feature Tree
-        last_feature = self.get_last_feature(document)
+            # Execute SW-API method - show freeze bar ( once per session )
+            if not self._freeze_bar:
+                SolidWorks.client.SetUserPreferenceToggle(self._FREEZE_BAR, True)
+                self._freeze_bar = True
 
-        # Execute SW-API method - move freeze bar past last feature
-        document.swobj.FeatureManager.EditFreeze(
-            position, last_feature.Name, True
-        )
+            # Get last feature in Feature Tree ( nothing to freeze when empty )
+            if (last_feature := self.get_last_feature(document)) is None:
+                log.warning("no features to freeze: '%s'", document.name)
+                return None
+
+            # Execute SW-API method - move freeze bar past last feature
+            document.feature_manager.EditFreeze(
+                self._FREEZE_POSITION, last_feature.Name, True
+            )
 
     # LOW-LEVEL METHODS
     def get_last_feature(self, document: SWDocument) -> Any:
         '''Gets the last feature in a document's Feature Tree.'''
         log.debug('getting last feature in Feature Tree')
-        
-        # Gather necessary components of the Feature Tree
-        manager = document.swobj.FeatureManager     # get Feature Manager
-        tree = manager.GetFeatureTreeRootItem2(0)   # get Feature Tree root
-        count = manager.GetFeatureCount(True)       # get # of features
 
-        # Iterate over tree to find last item ( yes, this is the only way... )
-        feature = tree.GetFirstChild        # start with first feature
-        for feature in range(count):        # iterate through features
-            if feature.GetNext:             # if there's a next feature...
-                feature = feature.GetNext   # ...re-assign current
-        return feature.Object               # return the final feature
+        # Execute SW-API method - all features in a single marshalled call
+        features = document.feature_manager.GetFeatures(True)
+        return features[-1] if features else None
+
+    # ASYNCHRONOUS METHODS
+    async def open_async(self, filepath: Filepath) -> SWDocument:
+        '''Opens a document in a worker thread ( see open ).'''
+        return await run_com(self.open, filepath)
+
+    async def close_async(self, document: SWDocument) -> None:
+        '''Closes a document in a worker thread ( see close ).'''
+        return await run_com(self.close, document)
+
+    async def save_async(self, document: SWDocument, rebuild: bool = True) -> None:
+        '''Saves a document in a worker thread ( see save ).'''
+        return await run_com(self.save, document, rebuild)
+
+    async def rebuild_async(self, document: SWDocument, top_only: bool = False) -> None:
+        '''Rebuilds a document in a worker thread ( see rebuild ).'''
+        return await run_com(self.rebuild, document, top_only)
+
+    async def export_async(self, document: SWDocument, as_type: SWExportFormat,
+        destination: Filepath = None) -> None:
+        '''Exports a document in a worker thread ( see export ). Await it
+        alongside open_async / Vault.checkin_async to overlap the export's
+        file write with the next document's open & the last one's check in.'''
+        return await run_com(self.export, document, as_type, destination)
+
+    async def batch_open(self, filepaths: List[Filepath]) -> List[SWDocument]:
+        '''Opens a collection of documents concurrently.'''
+        with self.bulk():
+            return await asyncio.gather(
+                *(self.open_async(file) for file in filepaths)
+            )
 
 
 @singleton
@@ -258,51 +574,76 @@ class Vault:
 
     # CLASS ATTRIBUTES
     client: Any = None
+    __slots__ = ('name', 'authorized', '_file_cache', '_transition_cache')
+
+    # Client ProgID ( bound once, read on every connect )
+    _DISPATCH_KEY = VAULT_DISPATCH_KEY
 
     # FUNDAMENTAL METHODS
     def __init__(self, name: str) -> None:
+        init_com_thread()
         self.name = name
         self.authorized = SWAuthState.UNAUTHORIZED
+        self._file_cache: Dict[str, Tuple[Any, Any]] = {}   # by complete path
+        self._transition_cache: Dict[Tuple[int, str], Dict[str, Any]] = {}
         
     # LIFETIME MANAGEMENT METHODS
     def connect(self) -> bool:
         '''Creates a connection to the PDM Vault client.'''
-        log.critical(f"connecting to PDM Vault ( {self.name} )")
+        log.critical("connecting to PDM Vault ( %s )", self.name)
+
+        # Reuse an existing session for this vault
+        if (com_object := vault_sessions.get(self.name)):
+            log.info('reusing existing connection')
+            Vault.client = com_object
+            return self.authorize()
         
         # Attempt new client dispatch
         log.info('establishing connection...')
         try:
-            pycom.CoInitialize()
-            if (com_object := win.Dispatch(VAULT_DISPATCH_KEY)):
+            if (com_object := self._dispatch()):
                 Vault.client = com_object
                 log.info('connected successfully established')
-                return self.authorize()
+                if not self.authorize():
+                    return False
+                vault_sessions[self.name] = com_object
+                return True
         except Exception as exception:
             log.error('failed to establish connection')
             log.error(exception)
             return False
 
     def disconnect(self) -> bool:
-        '''Terminates the PDM Vault connection.'''
-        log.critical(f"disconnecting from PDM Vault ( {self.name} )")
-
-        # Attempt to disconnect from the process
-        try:
-            pycom.CoUninitialize()
-            Vault.client = None
-            self.authorized = SWAuthState.UNAUTHORIZED
-            log.info('connection successfully terminated')
-            return True
-        except Exception as exception:
-            log.error('failed to disconnect from PDM Vault client')
-            log.error(exception)
-            return False
+        """
+        Terminates the PDM Vault connection.
+        
+        The authenticated session is kept alive so that a later connect()
+        can reuse it. Use logout() to end the session entirely.
+        """
+        log.critical("disconnecting from PDM Vault ( %s )", self.name)
+        Vault.client = None
+        self.authorized = SWAuthState.UNAUTHORIZED
+        self._file_cache.clear()
+        self._transition_cache.clear()
+        log.info('connection successfully terminated')
+        return True
+
+    def logout(self) -> bool:
+        '''Terminates the PDM Vault connection and its underlying session.'''
+        self.disconnect()
+        log.info('ending PDM session')
+        vault_sessions.pop(self.name, None)
+        log.info('session successfully ended')
+        return True
 
     def authorize(self) -> bool:
         '''Authenticates login credentials for the PDM Vault.'''
         log.info('authenticating PDM credentials...')
 
-        # Check for existing authorization
+        # Check for existing authorization ( local flag first, then PDM-API )
+        if self.authorized == SWAuthState.AUTHORIZED:
+            log.info('credentials already authenticated')
+            return True
         if Vault.client.IsLoggedIn:
             log.info('credentials successfully authenticated')
             self.authorized = SWAuthState.AUTHORIZED
@@ -312,14 +653,76 @@ class Vault:
         try:
             # Execute PDM-API method
             Vault.client.LoginAuto(self.name, 0)
-            self.authorized = SWAuthState.AUTHORIZED
-            log.info('credentials successfully authenticated')
-            return True
         except Exception as exception:
             log.error('failed authenticate login credentials')
             log.error(exception)
             return False
 
+        # Confirm the login before trusting the local flag
+        if not Vault.client.IsLoggedIn:
+            log.error('failed authenticate login credentials')
+            return False
+        self.authorized = SWAuthState.AUTHORIZED
+        log.info('credentials successfully authenticated')
+        return True
+
+    def _dispatch(self) -> Any:
+        '''Dispatches a new early-bound PDM client ( IEdmVault7 ).'''
+        return win.CastTo(gencache.EnsureDispatch(self._DISPATCH_KEY), 'IEdmVault7')
+
+    # CACHE MANAGEMENT METHODS
+    def invalidate_folder_cache(self) -> None:
+        '''Discards all cached PDM folder & file lookups. Call this after
+        structural changes to the PDM Vault ( folders moved, renamed, deleted,
+        etc. ).'''
+        log.debug('invalidating PDM folder cache')
+        self._file_cache.clear()
+        self._transition_cache.clear()
+
+    def _session(self) -> Tuple[Any, Dict, Dict]:
+        '''Gets the PDM client & lookup caches for the calling thread: a batch
+        worker's own ( see batch ), otherwise the shared connection's.'''
+        return getattr(com_thread_state, 'vault_worker', None) or (
+            Vault.client, self._file_cache, self._transition_cache
+        )
+
+    def _resolve(self, filepath: Filepath) -> Tuple[Any, Any]:
+        '''Gets a PDM file & its parent folder, resolving each path once.
+        Raises FileNotFoundError for paths that aren't in the vault.'''
+        client, file_cache, _ = self._session()
+        entry = file_cache.get(filepath.complete)
+        if entry is None:
+            # Execute PDM-API method - file & parent folder in a single call
+            file, directory = client.GetFileFromPath(filepath.complete)
+            if file is None:                            # not in the vault; not cached
+                log.error("file not found in PDM Vault: '%s'", filepath.name)
+                raise FileNotFoundError(filepath.complete)
+            entry = (directory, file)                   # IEdmFolder, IEdmFile
+            file_cache[filepath.complete] = entry
+        return entry
+
+    def _forget(self, filepath: Filepath) -> None:
+        '''Drops a cached PDM file after its state has been changed.'''
+        self._session()[1].pop(filepath.complete, None)
+        self._file_cache.pop(filepath.complete, None)
+
+    def _transitions(self, file: Any) -> Dict[str, Any]:
+        '''Gets the transitions out of a file's current PDM state, keyed by
+        name. Each ( file, state ) pair is enumerated once.'''
+        transition_cache = self._session()[2]
+        current = file.CurrentState                     # IEdmState
+        key = (file.ID, current.Name)
+        transitions = transition_cache.get(key)
+        if transitions is None:
+            transitions = transition_cache[key] = {
+                transition.Name: transition             # IEdmTransition
+                for transition in iterate_com_list(
+                    current.GetFirstTransitionPosition(),
+                    current.GetNextTransition
+                )
+            }
+        return transitions
+
     # FILE STATE METHODS
     def checkin(self, filepath: Filepath, comment: str = None) -> None:
         """
@@ -328,11 +731,10 @@ class Vault:
         IMPORTANT: this method will not work if the file is currently
         open as a document in SolidWorks. Close the file before use.
         """
-        log.info(f"checking in file: '{filepath.name}'")
+        log.info("checking in file: '%s'", filepath.name)
 
         # Get PDM-API objects
-        directory = Vault.client.GetFolderFromPath(filepath.directory)  # IEdmFolder
-        file = directory.GetFile(filepath.name)                         # IEdmFile
+        directory, file = self._resolve(filepath)       # IEdmFolder, IEdmFile
 
         # Format a check in comment
         message = AUTOMATION_MESSAGE
@@ -341,11 +743,12 @@ class Vault:
 
         # Check current document state         
         if not file.IsLocked:
-            log.info(f"file is already checked in: '{filepath.name}'")
+            log.info("file is already checked in: '%s'", filepath.name)
             return None
         
         # Execute PDM-API method    
         file.UnlockFile(0, message)
+        self._forget(filepath)
             
     def checkout(self, filepath: Filepath) -> None:
         """
@@ -354,19 +757,19 @@ class Vault:
         IMPORTANT: this method will not work if the file is currently
         open as a document in SolidWorks. Close the file before use.
         """
-        log.info(f"checking out file: '{filepath.name}'")
+        log.info("checking out file: '%s'", filepath.name)
 
         # Get PDM-API objects
-        directory = Vault.client.GetFolderFromPath(filepath.directory)  # IEdmFolder
-        file = directory.GetFile(filepath.name)                         # IEdmFile
+        directory, file = self._resolve(filepath)       # IEdmFolder, IEdmFile
 
         # Check current document state
         if file.IsLocked:
-            log.info(f"file is already checked out: '{filepath.name}'")
+            log.info("file is already checked out: '%s'", filepath.name)
             return None
         
         # Execute PDM-API method
         file.LockFile(directory.ID, 0)
+        self._forget(filepath)
 
     def undo_checkout(self, filepath: Filepath) -> None:
         """
@@ -375,59 +778,259 @@ class Vault:
         IMPORTANT: this method will not work if the file is currently
         open as a document in SolidWorks. Close the file before use.
         """
-        log.info(f"undoing check out: '{filepath.name}'")
+        log.info("undoing check out: '%s'", filepath.name)
 
         # Get PDM-API objects
-        directory = Vault.client.GetFolderFromPath(filepath.directory)  # IEdmFolder
-        file = directory.GetFile(filepath.name)                         # IEdmFile
+        directory, file = self._resolve(filepath)       # IEdmFolder, IEdmFile
 
         # Check current document state
         if not file.IsLocked:
-            log.info(f"file is not checked out: '{filepath.name}'")
+            log.info("file is not checked out: '%s'", filepath.name)
             return None
         
         # Execute PDM-API method
         file.UndoLockFile(0)
+        self._forget(filepath)
+
+    # BATCH FILE STATE METHODS
+    def batch_checkin(self, filepaths: List[Filepath], comment: str = None) -> None:
+        """
+        Checks in a collection of documents to the PDM Vault as a single
+        PDM transaction.
+        
+        IMPORTANT: this method will not work if the files are currently
+        open as documents in SolidWorks. Close the files before use.
+        """
+        log.info("checking in %d files", len(filepaths))
+
+        # Format a check in comment
+        message = AUTOMATION_MESSAGE
+        if comment:
+            message = message + ': ' + comment
+
+        # Gather selection items for every checked out file
+        selection: List = []
+        for filepath in filepaths:
+            directory, file = self._resolve(filepath)       # IEdmFolder, IEdmFile
+            if not file.IsLocked:
+                log.info("file is already checked in: '%s'", filepath.name)
+                continue
+            item = win.Record('EdmSelItem', Vault.client)   # EdmSelItem
+            item.mlDocID = file.ID
+            item.mlProjID = directory.ID
+            selection.append(item)
+        if not selection:
+            return None
+
+        # Execute PDM-API method - IEdmBatchUnlock ( per-file if unavailable )
+        try:
+            utility = Vault.client.CreateUtility(BATCH_UNLOCK_UTILITY)
+        except Exception as exception:
+            log.warning('batch check in unavailable, checking in per file')
+            log.warning(exception)
+            for filepath in filepaths:
+                self.checkin(filepath, comment)
+            return None
+        utility.AddSelection(Vault.client, selection)
+        utility.CreateTree(0, BATCH_UNLOCK_FLAGS)
+        utility.Comment = message
+        utility.UnlockFiles(0, None)
+        for filepath in filepaths:
+            self._forget(filepath)
+
+    def batch_checkout(self, filepaths: List[Filepath]) -> None:
+        """
+        Checks out a collection of documents from the PDM Vault as a single
+        PDM transaction.
+        
+        IMPORTANT: this method will not work if the files are currently
+        open as documents in SolidWorks. Close the files before use.
+        """
+        log.info("checking out %d files", len(filepaths))
+
+        # Create PDM-API utility - IEdmBatchGet ( per-file if unavailable )
+        try:
+            utility = Vault.client.CreateUtility(BATCH_GET_UTILITY)
+        except Exception as exception:
+            log.warning('batch check out unavailable, checking out per file')
+            log.warning(exception)
+            for filepath in filepaths:
+                self.checkout(filepath)
+            return None
+
+        # Gather selections for every checked in file
+        selected: int = 0
+        for filepath in filepaths:
+            directory, file = self._resolve(filepath)       # IEdmFolder, IEdmFile
+            if file.IsLocked:
+                log.info("file is already checked out: '%s'", filepath.name)
+                continue
+            utility.AddSelectionEx(
+                Vault.client, file.ID, directory.ID, file.CurrentVersion
+            )
+            selected += 1
+        if not selected:
+            return None
+
+        # Execute PDM-API method - IEdmBatchGet
+        utility.CreateTree(0, BATCH_GET_LOCK)
+        utility.GetFiles(0, None)
+        for filepath in filepaths:
+            self._forget(filepath)
+
+    # PARALLEL FILE STATE METHODS
+    def checkin_many(self, filepaths: List[Filepath], comment: str = None,
+        max_workers: int = VAULT_WORKERS_DEFAULT) -> None:
+        """
+        Checks in a collection of documents to the PDM Vault, one check in
+        per file, spread across a pool of worker threads. Each file keeps its
+        own history entry; use batch_checkin for a single PDM transaction.
+        
+        IMPORTANT: this method will not work if the files are currently
+        open as documents in SolidWorks. Close the files before use.
+        """
+        log.info("checking in %d files", len(filepaths))
+        self.batch(filepaths, functools.partial(self.checkin, comment=comment),
+            max_workers)
+
+    def batch(self, filepaths: List[Filepath], operation: Callable[[Filepath], Any],
+        max_workers: int = VAULT_WORKERS_DEFAULT) -> List[Any]:
+        """
+        Applies a single-file Vault operation ( ex. vault.get_state ) to a
+        collection of files, spread across a pool of worker threads. Each
+        worker dispatches & logs in its own PDM client, which Vault methods
+        called on that thread use in place of the shared one.
+        
+        Results are returned in the order of 'filepaths'; files whose
+        operation failed are logged and yield None.
+        """
+        log.debug("running batch of %d files ( %d workers )", len(filepaths), max_workers)
+        if not filepaths:
+            return []
+
+        # One Future per file, drained from a shared queue by the workers
+        pending: queue.SimpleQueue = queue.SimpleQueue()
+        futures: List[Future] = []
+        for filepath in filepaths:
+            futures.append(future := Future())
+            pending.put((future, filepath))
+
+        # Each worker owns its thread, client & COM apartment from start to end
+        workers = min(max_workers, len(filepaths))
+        with ThreadPoolExecutor(workers) as pool:
+            failures = [
+                pool.submit(self._run_worker, pending, operation)
+                for _ in range(workers)
+            ]
+
+        # Files left over when no worker could connect fail with its error
+        failure = next(filter(None, (worker.result() for worker in failures)), None)
+        while True:
+            try:
+                future, filepath = pending.get_nowait()
+            except queue.Empty:
+                break
+            future.set_exception(failure)
+        return collect_results(futures, filepaths)
+
+    def _run_worker(self, pending: queue.SimpleQueue,
+        operation: Callable[[Filepath], Any]) -> Exception:
+        '''Runs queued batch operations on a worker thread with its own PDM
+        client. A worker that fails to log in takes no files, leaving them to
+        the others, and returns its error.'''
+        try:
+            try:
+                init_com_thread()
+                client = self._dispatch()
+                client.LoginAuto(self.name, 0)
+                if not client.IsLoggedIn:
+                    raise RuntimeError("worker failed to log in to PDM Vault ( %s )" % self.name)
+            except Exception as exception:
+                log.error("batch worker failed to connect to PDM Vault ( %s )", self.name)
+                log.error(exception)
+                client = None
+                return exception
+            com_thread_state.vault_worker = (client, {}, {})    # client, file & transition caches
+            client = None       # the worker session holds the only live reference
+
+            # Work through the shared queue until it runs dry
+            while True:
+                try:
+                    future, filepath = pending.get_nowait()
+                except queue.Empty:
+                    return None
+                if not future.set_running_or_notify_cancel():
+                    continue
+                try:
+                    future.set_result(operation(filepath))
+                except Exception as exception:
+                    future.set_exception(exception)
+        finally:
+            # Release this worker's PDM objects before leaving the apartment
+            com_thread_state.vault_worker = None
+            if getattr(com_thread_state, 'multithreaded', False):
+                com_thread_state.initialized = False
+                pycom.CoUninitialize()
+
+    def map_metadata(self, filepaths: List[Filepath], query: str,
+        max_workers: int = VAULT_WORKERS_DEFAULT) -> List[Any]:
+        """
+        Runs a read-only data retrieval method ( named by 'query', ex.
+        'get_state' ) over a collection of files in a pool of worker
+        processes, each holding its own PDM Vault connection. Suited to large
+        metadata sweeps.
+        
+        Results are returned in the order of 'filepaths'; files whose query
+        failed ( or every file, for an unsupported query ) yield None.
+        
+        IMPORTANT: worker processes are spawned by re-importing the calling
+        script, so call this from under an "if __name__ == '__main__':" guard.
+        """
+        if query not in metadata_queries:
+            log.warning("unsupported metadata query: '%s'", query)
+            return [None] * len(filepaths)
+        log.info("querying %d files ( %d processes )", len(filepaths), max_workers)
+
+        # Each worker process connects to the vault once, on start up
+        with ProcessPoolExecutor(max_workers, initializer=init_vault_process,
+            initargs=(self.name,)) as pool:
+            futures = [
+                pool.submit(run_vault_query, query, filepath)
+                for filepath in filepaths
+            ]
+        return collect_results(futures, filepaths)
+
+    # ASYNCHRONOUS METHODS
+    async def checkin_async(self, filepath: Filepath, comment: str = None) -> None:
+        '''Checks in a document in a worker thread ( see checkin ).'''
+        return await run_com(self.checkin, filepath, comment)
+
+    async def checkout_async(self, filepath: Filepath) -> None:
+        '''Checks out a document in a worker thread ( see checkout ).'''
+        return await run_com(self.checkout, filepath)
 
     # WORKFLOW STATE METHODS
     def change_state(self, filepath: Filepath, transition: str, comment: str = None) -> None:
         '''Changes the PDM state of a file using a provided transition.'''
 
         # Get PDM-API objects
-        directory = Vault.client.GetFolderFromPath(filepath.directory)  # IEdmFolder
-        file = directory.GetFile(filepath.name)                         # IEdmFile
-        
-        # Get all possible transitions
-        index: int = 0
-        transitions: List = []
-        current = file.CurrentState
-        position = current.GetFirstTransitionPosition()
-        while not position.IsNull:
-            possibility = current.GetNextTransition(position)
-            transitions.append(possibility)
-            index += 1
+        directory, file = self._resolve(filepath)       # IEdmFolder, IEdmFile
         
         # Get next state by checking against possible transitions
-        found: bool = False
-        for test in transitions:
-            if test.Name == transition:
-                next_state = test.ToState
-                log.info(fr"transitioning file ( '{filepath.name}' ) to state: {next_state.Name}")
-                found = True
-        if not found:
-            log.warning(f"failed to execute transition: '{transition}'")
+        if (possibility := self._transitions(file).get(transition)) is None:
+            log.warning("failed to execute transition: '%s'", transition)
             return
+        next_state = possibility.ToState
+        if log.isEnabledFor(logging.INFO):  # state name is a COM round trip
+            log.info("transitioning file ( '%s' ) to state: %s", filepath.name, next_state.Name)
         
         # Format a default comment
         if comment is None:
             comment = AUTOMATION_MESSAGE
 
-        # Define COM VARIANT args
-        arg1 = win.VARIANT(pycom.VT_I4, int(directory.ID))
-        arg2 = win.VARIANT(pycom.VT_BSTR, comment)
-
-        # SolidWorks API call
-        file.ChangeState(next_state, arg1.value, arg2.value, 0)
+        # SolidWorks API call ( plain values; the type library packs them )
+        file.ChangeState(next_state, int(directory.ID), comment, 0)
+        self._forget(filepath)
 
     # DATA RETRIEVAL METHODS
     def get_revision(self, filepath: Filepath) -> str:
@@ -435,16 +1038,14 @@ class Vault:
         log.debug('release revision')
 
         # Get PDM-API objects
-        directory = Vault.client.GetFolderFromPath(filepath.directory)  # IEdmFolder
-        file = directory.GetFile(filepath.name)                         # IEdmFile
+        directory, file = self._resolve(filepath)       # IEdmFolder, IEdmFile
         return file.CurrentRevision
     
     def get_state(self, filepath: Filepath) -> str:
         '''Gets a file's current PDM state.'''
         
         # Get PDM-API objects
-        directory = Vault.client.GetFolderFromPath(filepath.directory)  # IEdmFolder
-        file = directory.GetFile(filepath.name)                         # IEdmFile
+        directory, file = self._resolve(filepath)       # IEdmFolder, IEdmFile
         return file.CurrentState.Name
 
     def get_transitions(self, filepath: Filepath) -> List[str]:
@@ -452,92 +1053,208 @@ class Vault:
         PDM state.'''
         
         # Get PDM-API objects
-        directory = Vault.client.GetFolderFromPath(filepath.directory)  # IEdmFolder
-        file = directory.GetFile(filepath.name)                         # IEdmFile
-        
-        index: int = 0
-        transitions: List = []
-        current = file.CurrentState
-        position = current.GetFirstTransitionPosition()
-        while not position.IsNull:
-            transition = current.GetNextTransition(position)
-            transitions.append(transition.Name)
-            index += 1
-        return transitions
+        directory, file = self._resolve(filepath)       # IEdmFolder, IEdmFile
+        return list(self._transitions(file))
 
     def get_checkout_user(self, filepath: Filepath) -> Any:
         
         # Get PDM-API objects
-        directory = Vault.client.GetFolderFromPath(filepath.directory)  # IEdmFolder
-        file = directory.GetFile(filepath.name)                         # IEdmFile
+        directory, file = self._resolve(filepath)       # IEdmFolder, IEdmFile
         if file.IsLocked:
             return file.LockedByUser.Name
 
     def get_configurations(self, filepath: Filepath) -> List[str]:
 
         # Get PDM-API objects
-        directory = Vault.client.GetFolderFromPath(filepath.directory)  # IEdmFolder
-        file = directory.GetFile(filepath.name)                         # IEdmFile
+        directory, file = self._resolve(filepath)       # IEdmFolder, IEdmFile
         configs = file.GetConfigurations()
 
-        index: int = 0
-        results: List = []
-        position = configs.GetHeadPosition()
-        while not position.IsNull:
-            value = configs.GetNext(position)
-            results.append(value)
-            index += 1
-        if '@' in results:
-            results.remove('@')
-        return results
+        # Skip the file-level '@' pseudo-configuration while enumerating
+        return [
+            value for value in
+            iterate_com_list(configs.GetHeadPosition(), configs.GetNext)
+            if value != '@'
+        ]
 
 # FUNCTIONS
 def prepare_export(document: SWDocument, target_format: SWExportFormat,
-        destination: Filepath = None) -> Filepath:
-    '''Prepares a document for an export operation.'''
-    log.debug(f"preparing document for export: '{document.source.name}'")
+        destination: Filepath = None) -> str:
+    '''Prepares a document for an export operation; returns the complete
+    output path.'''
+    log.debug("preparing document for export: '%s'", document.name)
     
     # Check for incompatible types
     supported_formats = export_matrix[document.doctype]
-    if not target_format in supported_formats:
-        log.warning(f"cannot export document: '{document.source.name}'") 
-        log.warning(f"incompatible format: '{target_format.value}'")
+    if target_format not in supported_formats:
+        log.warning("cannot export document: '%s'", document.name) 
+        log.warning("incompatible format: '%s'", target_format.value)
         return None
 
     # Format destination
     if not destination:
         log.debug('no destination specified, using default')
-        desktop = os.path.join(os.environ['USERPROFILE'], 'Desktop')
-        destination = Filepath(desktop + '\\' + EXPORT_FOLDER_DEFAULT)
+        destination = default_export_destination()
 
-    # Set up valid destination
-    if not Path(destination.complete).exists():
-        log.debug('destination does not exist, creating new folder')
-        os.makedirs(destination.complete)
+    # Set up valid destination ( checked once per directory )
+    if destination.complete not in verified_destinations:
+        if not Path(destination.complete).exists():
+            log.debug('destination does not exist, creating new folder')
+            os.makedirs(destination.complete, exist_ok=True)
+        verified_destinations.add(destination.complete)
 
-    # Format output file
+    # Format output file ( passed straight to SaveAs2; no Filepath re-parse )
     root = document.source.root
     extension = target_format.value
-    return Filepath(fr"{destination.complete}\{root}.{extension}")
+    return os.path.join(destination.complete, root + '.' + extension)
+
+
+def iterate_com_list(position: Any, getter: Callable) -> Iterator[Any]:
+    '''Yields the items of a PDM-API position-based list ( IEdmPos5 ), where
+    'getter' advances the position with each call.'''
+    while not position.IsNull:
+        yield getter(position)
+
+
+@functools.lru_cache(maxsize=None)
+def default_export_destination() -> Filepath:
+    '''Formats the default export folder on the user's desktop.'''
+    desktop = os.path.join(os.environ['USERPROFILE'], 'Desktop')
+    return Filepath(os.path.join(desktop, EXPORT_FOLDER_DEFAULT))
+
+
+def init_vault_process(name: str) -> None:
+    '''Connects a Vault worker process to the PDM Vault ( see map_metadata ).
+    A failed connection is reported by each query, not here: raising would
+    break the whole process pool.'''
+    try:
+        com_thread_state.vault_connected = Vault(name).connect()
+    except Exception as exception:
+        log.error(exception)
+        com_thread_state.vault_connected = False
+
+
+def run_vault_query(query: str, filepath: Filepath) -> Any:
+    '''Runs a data retrieval method on a Vault worker process's connection.'''
+    if not getattr(com_thread_state, 'vault_connected', False):
+        raise RuntimeError("worker is not connected to the PDM Vault")
+    return getattr(Vault(), query)(filepath)
+
+
+def collect_results(futures: List[Future], filepaths: List[Filepath]) -> List[Any]:
+    '''Gathers per-file results in order, logging failures as None rather than
+    aborting the remaining files.'''
+    results: List[Any] = []
+    for future, filepath in zip(futures, filepaths):
+        if (exception := future.exception()):
+            log.error("batch operation failed for file: '%s'", filepath.name)
+            log.error(exception)
+            results.append(None)
+        else:
+            results.append(future.result())
+    return results
+
+
+async def run_com(func: Callable, *args, **kwargs) -> Any:
+    '''Runs a blocking COM call in a worker thread so that the event loop can
+    overlap it with other calls ( inline from a single-threaded apartment ).'''
+    if not is_multithreaded():
+        # Clients owned by a single-threaded apartment can't leave this thread
+        return func(*args, **kwargs)
+    def call() -> Any:
+        init_com_thread()
+        return func(*args, **kwargs)
+    return await asyncio.to_thread(call)
+
+
+def init_com_thread() -> None:
+    """
+    Joins the calling thread to the multithreaded COM apartment ( once per
+    thread ). COM objects created in this apartment can be shared between
+    threads without marshalling, so call this at the start of any worker
+    thread that uses SolidWrap objects.
+    """
+    if getattr(com_thread_state, 'initialized', False):
+        return None
+    try:
+        pycom.CoInitializeEx(pycom.COINIT_MULTITHREADED)
+    except pycom.com_error as error:
+        # Already joined to a single-threaded apartment ( ex. the thread that
+        # imported pythoncom, or a GUI thread ); keep it, and leave its
+        # teardown to whoever initialized it
+        if error.hresult != RPC_E_CHANGED_MODE:
+            raise
+        log.info('thread is in a single-threaded COM apartment; its clients '
+            'stay on it ( worker-thread methods run inline )')
+        com_thread_state.initialized = True
+        com_thread_state.multithreaded = False
+        return None
+    com_thread_state.initialized = True
+    com_thread_state.multithreaded = True
+    if threading.current_thread() is threading.main_thread():
+        atexit.register(pycom.CoUninitialize)
+
+
+def is_multithreaded() -> bool:
+    '''Checks whether the calling thread is in the multithreaded COM apartment,
+    i.e. whether COM objects it creates may be used by worker threads.'''
+    init_com_thread()
+    return com_thread_state.multithreaded
+
+
+def status_variants(errors: int = 0, warnings: int = 0) -> Tuple[Any, Any]:
+    '''Returns the calling thread's reusable BYREF errors / warnings VARIANTs,
+    reset to the given values.'''
+    pair = getattr(com_thread_state, 'status_variants', None)
+    if pair is None:
+        pair = com_thread_state.status_variants = (
+            win.VARIANT(pycom.VT_BYREF | pycom.VT_I4, errors),
+            win.VARIANT(pycom.VT_BYREF | pycom.VT_I4, warnings)
+        )
+    else:
+        pair[0].value = errors
+        pair[1].value = warnings
+    return pair
 
 
 # OBJECTS
+# Per-thread COM initialization flags, reusable out-param VARIANTs & Vault
+# batch worker sessions
+com_thread_state = threading.local()
+
+# COM VARIANT factories for per-call values ( VT tags bound at import )
+bstr_variant = functools.partial(win.VARIANT, pycom.VT_BSTR)
+
+# Vault methods that may run in worker processes ( read-only )
+metadata_queries: FrozenSet[str] = frozenset({
+    'get_checkout_user',
+    'get_configurations',
+    'get_revision',
+    'get_state',
+    'get_transitions'
+})
+
+# Export folders already confirmed to exist during this session
+verified_destinations: Set[str] = set()
+
+# Authenticated PDM Vault clients, shared across reconnects ( keyed by name )
+vault_sessions: Dict[str, Any] = {}
+
 # Which document types are compatible with which export formats?
-export_matrix: Dict[SWDocType, List[SWExportFormat]] = {
-    SWDocType.PART: [
+export_matrix: Dict[SWDocType, FrozenSet[SWExportFormat]] = {
+    SWDocType.PART: frozenset({
         SWExportFormat.IMAGE,
         SWExportFormat.PARASOLID,
         SWExportFormat.STEP,
         SWExportFormat.STL
-    ],
-    SWDocType.ASSEMBLY: [
+    }),
+    SWDocType.ASSEMBLY: frozenset({
         SWExportFormat.IMAGE,
         SWExportFormat.PARASOLID,
         SWExportFormat.STEP,
         SWExportFormat.STL
-    ],
-    SWDocType.DRAWING: [
+    }),
+    SWDocType.DRAWING: frozenset({
         SWExportFormat.DXF,
         SWExportFormat.PDF
-    ]
+    })
 }
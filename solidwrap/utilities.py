@@ -5,16 +5,39 @@ from __future__ import annotations
 
 # IMPORTS - STANDARD LIBRARY
 import functools
+import os
+import threading
 
 
 # CONSTANTS
 AUTOMATION_MESSAGE      = 'automated action using SolidWrap'
 EXPORT_FOLDER_DEFAULT   = 'SolidWrap Exports'
-SUBPROCESS_NAME         = f"Taskkill /IM SLDWORKS.exe /F"
+SUBPROCESS_NAME         = 'Taskkill /IM SLDWORKS.exe /F'   # DEPRECATED: unused, kept for imports
 VAULT_DISPATCH_KEY      = 'ConisioLib.EdmVault'
 
+# Background document loading
+BACKGROUND_OPEN_THRESHOLD   = 50 * 1024 ** 2    # bytes
+BACKGROUND_POLL_INTERVAL    = 0.05              # seconds
+BACKGROUND_LOAD_TIMEOUT     = 300.0             # seconds
+
+# Application shutdown
+EXIT_TIMEOUT    = 10.0  # seconds to wait for ExitApp before killing the process
+
+# Parallel PDM operations ( worker count overridable via environment )
+VAULT_WORKERS_FALLBACK  = 4
+
+# COM HRESULTs
+RPC_E_CHANGED_MODE      = -2147417850   # thread's apartment can't be changed
+
+# PDM-API enumerations
+BATCH_GET_UTILITY       = 12    # EdmUtility.EdmUtil_BatchGet
+BATCH_UNLOCK_UTILITY    = 13    # EdmUtility.EdmUtil_BatchUnlock
+BATCH_GET_LOCK          = 1     # EdmGetCmdFlags.Egcf_Lock
+BATCH_UNLOCK_FLAGS      = 0     # EdmUnlockBuildTreeFlags.Eubtf_Nothing
+
 
 # FUNCTIONS
+@functools.lru_cache(maxsize=8)
 def compute_client_key(version: int) -> str:
     """
     Formats the appropriate SolidWorks application client name based on
@@ -32,10 +55,23 @@ def compute_client_key(version: int) -> str:
 #     """
 #     try:
 #         return func(*args, **kwargs)
-#     except Exception as exception:
-#         print('ERROR: exception during SolidWorks API call')
-#         print(exception)
-#         print(traceback.print_exc())
+#     except Exception:
+#         log.exception('exception during SolidWorks API call')
+
+
+def read_worker_count(variable: str, fallback: int) -> int:
+    """
+    Reads a positive worker count from an environment variable. Missing or
+    malformed values fall back to the default rather than failing import.
+    """
+    try:
+        count = int(os.environ.get(variable, fallback))
+    except ValueError:
+        return fallback
+    return count if count > 0 else fallback
+
+# Resolved once, at import ( see read_worker_count )
+VAULT_WORKERS_DEFAULT = read_worker_count('SOLIDWRAP_VAULT_WORKERS', VAULT_WORKERS_FALLBACK)
 
 
 # DECORATORS
@@ -44,32 +80,44 @@ def singleton(cls):
     Gaurds an object against mutliple instantiation. New instances of the
     object will always return the singleton. This is DANGEROUS.
     """
+    instance = None                                 # held in the closure ( fast lookup )
+    lock = threading.Lock()                         # guards first instantiation only
+
     @functools.wraps(cls)                           # helper decorator to preserve class reference
     def wrapper(*args, **kwargs):
-        if not wrapper.instance:                    # if an instance doesn't exist...
-            wrapper.instance = cls(*args, **kwargs) # ...then store the instance
-        return wrapper.instance
-    wrapper.instance = None
+        nonlocal instance
+        if instance is not None:                    # fast path: no lock once created
+            return instance
+        with lock:
+            if instance is None:                    # if an instance doesn't exist...
+                instance = cls(*args, **kwargs)     # ...then store the instance
+        return instance
     return wrapper                                  # return the instance
 
 
 # CLASSES
 class FileSize:
 
+    # One instance per sized document; fixed slots keep them small
+    __slots__ = ('size_bytes', 'value', 'suffix', 'concatenated')
+
+    # Binary unit suffixes, one per power of 1024
+    _UNITS = ("B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB")
+
     # FUNDAMENTAL METHODS
     def __init__(self, size_bytes: float = 0.0) -> None:
-        self.value = size_bytes
-        self.suffix = self._calculate_suffix()
+        index = self._calculate_index(size_bytes)
+        self.size_bytes = size_bytes                # original byte count
+        self.value = size_bytes / (1 << (index * 10)) if index else size_bytes
+        self.suffix = self._UNITS[index]
         self.concatenated = str(f"{self.value:.2f} {self.suffix}")
 
     # PRIVATE METHODS
-    def _calculate_suffix(self) -> str:
-        units = ["B", "KB", "MB", "GB", "TB", "PB", "EB", "ZB", "YB"]
-        k = 1024.0
-        if self.value < k:
-            return "B"  # Return bytes if less than a kilobyte
-        i = 0
-        while self.value >= k and i < len(units) - 1:
-            self.value /= k
-            i += 1
-        return f"{units[i]}"
+    @classmethod
+    def _calculate_index(cls, size_bytes: float) -> int:
+        '''Picks the unit ( power of 1024 ) straight from the integer width;
+        each unit spans 10 bits.'''
+        n = int(size_bytes)
+        if n < 1024:
+            return 0    # bytes if less than a kilobyte
+        return min((n.bit_length() - 1) // 10, len(cls._UNITS) - 1)
@@ -0,0 +1,41 @@
+'''Copyright (c) 2024 Sean Yeatts. All rights reserved.'''
+
+from __future__ import annotations
+
+
+# IMPORTS
+from solidwrap.utilities import FileSize    # no COM required
+
+
+# FUNCTIONS
+def test_filesize_below_kilobyte() -> None:
+    size = FileSize(1023)
+    assert (size.size_bytes, size.value, size.suffix) == (1023, 1023, "B")
+    assert size.concatenated == "1023.00 B"
+
+
+def test_filesize_kilobyte_boundary() -> None:
+    size = FileSize(1024)
+    assert (size.size_bytes, size.value, size.suffix) == (1024, 1.0, "KB")
+    assert size.concatenated == "1.00 KB"
+
+
+def test_filesize_below_megabyte() -> None:
+    size = FileSize(2 ** 20 - 1)
+    assert (size.size_bytes, size.suffix) == (2 ** 20 - 1, "KB")
+    assert size.value == (2 ** 20 - 1) / 1024
+    assert size.concatenated == "1024.00 KB"
+
+
+def test_filesize_largest_unit() -> None:
+    size = FileSize(1024 ** 9)
+    assert (size.size_bytes, size.value, size.suffix) == (1024 ** 9, 1024.0, "YB")
+    assert size.concatenated == "1024.00 YB"
+
+
+# TOP LEVEL ENTRY POINT
+if __name__ == '__main__':
+    test_filesize_below_kilobyte()
+    test_filesize_kilobyte_boundary()
+    test_filesize_below_megabyte()
+    test_filesize_largest_unit()
@@ -6,6 +6,7 @@ from __future__ import annotations
 # IMPORTS
 from solidwrap import SolidWorks, Vault         # core classes
 from solidwrap import Filepath, SWExportFormat  # containers
+from functools import partial                   # pipeline operations
 
 
 # FUNCTIONS
@@ -18,12 +19,15 @@ def export_example(solidworks: SolidWorks, vault: Vault) -> None:
         Filepath(fr"C:\{vault.name}\Test_Part_03.SLDPRT")
     ]
 
-    # Export a variety of formats
-    for file in files:
-        if (document := solidworks.open(file)):
-            solidworks.export(document, SWExportFormat.IMAGE)      # .png
-            solidworks.export(document, SWExportFormat.PARASOLID)  # .x_t
-            solidworks.close(document)
+    # Export a variety of formats ( every file is queued up front )
+    operations = [
+        partial(solidworks.export, as_type=SWExportFormat.IMAGE),      # .png
+        partial(solidworks.export, as_type=SWExportFormat.PARASOLID),  # .x_t
+        solidworks.close
+    ]
+    pipelines = [solidworks.submit(file, operations) for file in files]
+    for pipeline in pipelines:
+        pipeline.result()
 
 
 # MAIN DEFINITION